@@ -0,0 +1,9 @@
+"""
+Version of the route-to-art package.
+
+This is the single source of the package version: setup.py and
+pyproject.toml read it from here, and the CLI imports it directly instead
+of scanning installed distributions.
+"""
+
+__version__ = "0.1.0"
@@ -10,8 +10,6 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-import yaml
-
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
@@ -86,7 +84,25 @@ class Config:
         self.config_path = config_path
         self.config = self.load_config()
     
-    def get_default_path(self) -> str:
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], config_path: Optional[str] = None) -> "Config":
+        """
+        Create a configuration manager from an already loaded configuration.
+        
+        Args:
+            config: Merged and validated configuration dictionary
+            config_path: Path of the file the configuration was loaded from
+            
+        Returns:
+            Config object wrapping the given dictionary
+        """
+        instance = cls.__new__(cls)
+        instance.config_path = config_path
+        instance.config = config
+        return instance
+    
+    @staticmethod
+    def get_default_path() -> str:
         """
         Get the default configuration file path.
         
@@ -125,6 +141,9 @@ class Config:
         Raises:
             ConfigError: If configuration file exists but can't be loaded or contains invalid values
         """
+        # PyYAML is only needed when a config file is actually parsed
+        import yaml
+        
         # Start with default configuration
         config = self._deep_copy(self.DEFAULT_CONFIG)
         
@@ -427,6 +446,8 @@ class Config:
         Returns:
             YAML string with sample configuration
         """
+        import yaml
+        
         return yaml.dump(self.DEFAULT_CONFIG, sort_keys=False, default_flow_style=False)
 
 """
@@ -441,8 +462,6 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 
-import yaml
-
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
@@ -511,8 +530,26 @@ class Config:
         """
         self.config_path = config_path
         self.config = self.load_config()
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], config_path: Optional[str] = None) -> "Config":
+        """
+        Create a configuration manager from an already loaded configuration.
+        
+        Args:
+            config: Merged and validated configuration dictionary
+            config_path: Path of the file the configuration was loaded from
+            
+        Returns:
+            Config object wrapping the given dictionary
+        """
+        instance = cls.__new__(cls)
+        instance.config_path = config_path
+        instance.config = config
+        return instance
         
-    def get_default_path(self) -> str:
+    @staticmethod
+    def get_default_path() -> str:
         """
         Get the default configuration file path.
         
@@ -547,6 +584,9 @@ class Config:
             ConfigError: If the configuration file exists but cannot be loaded
                         or contains invalid values.
         """
+        # PyYAML is only needed when a config file is actually parsed
+        import yaml
+        
         # Start with default configuration
         config = self.DEFAULT_CONFIG.copy()
         
@@ -774,5 +814,7 @@ class Config:
         Returns:
             YAML string with sample configuration
         """
+        import yaml
+        
         return yaml.dump(self.DEFAULT_CONFIG, sort_keys=False, default_flow_style=False)
 
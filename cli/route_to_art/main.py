@@ -2,25 +2,69 @@ import click
 import os
 import sys
 import functools
+import importlib
+import re
+import traceback
 from datetime import timedelta
-from importlib.metadata import version
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, TypeVar, cast
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Callable, TypeVar, cast
 
 # Import custom error handling and logging
-from route_to_art.config import Config
 from route_to_art.exceptions import (
     RouteArtError, RouteParseError, ValidationError, 
     RenderingError, ExportError, ConfigError
 )
-from route_to_art.exporters import Exporter
 from route_to_art.logging import (
     configure_for_cli, log_info, log_debug, log_error, 
     log_exception, log_warning, log_route_art_error
 )
-from route_to_art.models import Route
-from route_to_art.parsers import RouteParser
-from route_to_art.visualizer import RouteVisualizer
+
+if TYPE_CHECKING:
+    from route_to_art.config import Config
+    from route_to_art.models import Route
+
+# Modules pulling in matplotlib, gpxpy or PyYAML are only imported on first
+# use, so `--help`, `--version` and shell completion only need Click
+_LAZY_IMPORTS = {
+    "Config": "route_to_art.config",
+    "Exporter": "route_to_art.exporters",
+    "ExportFormat": "route_to_art.exporters",
+    "Route": "route_to_art.models",
+    "RouteParser": "route_to_art.parsers",
+    "RouteVisualizer": "route_to_art.visualizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily imported names on first access (PEP 562).
+    
+    The resolved object is cached in the module globals so later lookups
+    are plain attribute accesses.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(name: str) -> Any:
+    """
+    Get a lazily imported name from this module.
+    
+    Going through the module object (rather than importing from the source
+    module directly) keeps any patched attribute on this module in effect.
+    
+    Args:
+        name: Name listed in _LAZY_IMPORTS
+        
+    Returns:
+        The resolved class or object
+    """
+    return getattr(sys.modules[__name__], name)
+
 
 # Type variables for command handler decorator
 T = TypeVar('T')
@@ -28,15 +72,118 @@ ClickContext = Any  # Type for Click context
 CommandCallback = Callable[..., T]  # Type for command callbacks
 
 # Define the package version - will be used in the CLI's version option
-try:
-    __version__ = version("route-to-art")
-except Exception:
-    __version__ = "0.1.0"  # Default fallback version
+from route_to_art._version import __version__
 
 
 # Load and store configuration globally
 _config = None
 
+# Set to any non-empty value to always re-read the config file (no caching)
+DEV_ENV_VAR = "ROUTE_TO_ART_DEV"
+
+
+def get_config_cache_dir() -> Path:
+    """
+    Get the directory holding the on-disk configuration cache.
+    
+    Returns:
+        Path to the cache directory under $XDG_CACHE_HOME (or ~/.cache)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "route-to-art"
+
+
+def get_config_cache_path(config_path: str) -> Path:
+    """
+    Get the cache file for a configuration file.
+    
+    Each config file gets its own cache entry, named by a hash of its
+    absolute path, so switching between config files keeps both cached.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Path to the cache file
+    """
+    import hashlib
+    
+    digest = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()
+    return get_config_cache_dir() / f"{digest}.pkl"
+
+
+def clear_config_cache() -> None:
+    """Remove all cached configurations."""
+    try:
+        for cache_path in get_config_cache_dir().glob("*.pkl"):
+            cache_path.unlink(missing_ok=True)
+    except OSError as e:
+        log_warning(f"Could not remove config cache: {e}")
+
+
+def load_config(config_path: Optional[str] = None) -> "Config":
+    """
+    Load the configuration, reusing the on-disk cache when it is still valid.
+    
+    The cache holds the merged configuration dictionary, keyed by the config
+    file path, its modification time and the package version, so editing
+    the file or upgrading invalidates it. A cache hit skips parsing the YAML.
+    
+    Args:
+        config_path: Optional path to a configuration file
+        
+    Returns:
+        Config object
+        
+    Raises:
+        ConfigError: If the configuration file is invalid
+    """
+    # Only imported when a config is loaded, keeping them off the startup path
+    import pickle
+    import tempfile
+    
+    Config = _lazy_import("Config")
+    path = config_path or Config.get_default_path()
+    
+    # Nothing to cache when there is no config file or in development mode
+    if os.environ.get(DEV_ENV_VAR):
+        return Config(config_path=config_path)
+    try:
+        key = (os.path.abspath(path), os.stat(path).st_mtime_ns, __version__)
+    except OSError:
+        return Config(config_path=config_path)
+    
+    cache_path = get_config_cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key:
+            return Config.from_dict(cached_config, config_path=config_path)
+    except Exception:
+        # Missing, stale or unreadable cache, rebuild it below
+        pass
+    
+    config = Config(config_path=config_path)
+    
+    # Write to a temporary file of our own first, so concurrent runs never
+    # interleave their writes before the atomic replace
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            pickle.dump((key, config.config), f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log_debug(f"Could not write config cache: {e}")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+    
+    return config
+
+
 def get_config(config_path=None):
     """
     Get or initialize the configuration.
@@ -49,9 +196,53 @@ def get_config(config_path=None):
     """
     global _config
     if _config is None or config_path:
-        _config = Config(config_path=config_path)
+        try:
+            _config = load_config(config_path)
+        except RouteArtError:
+            raise
+        except Exception as e:
+            # Report config problems like other route-to-art errors rather
+            # than as unexpected failures in the command using the config
+            raise ConfigError(
+                "Error loading configuration",
+                original_error=e,
+                file_path=config_path
+            )
     return _config
 
+# Config keys (under "defaults") paired with the CLI options they provide
+CONFIG_TO_CLI = tuple(
+    (f"defaults.{config_key}", cli_key)
+    for config_key, cli_key in (
+        ("thickness", "thickness"),
+        ("color", "color"),
+        ("style", "style"),
+        ("markers.enabled", "markers"),
+        ("markers.unit", "markers_unit"),
+        ("markers.interval", "marker_interval"),
+        ("markers.size", "marker_size"),
+        ("markers.color", "marker_color"),
+        ("markers.label_font_size", "label_font_size"),
+        ("overlay.fields", "overlay"),
+        ("overlay.position", "overlay_position"),
+        ("overlay.font_size", "font_size"),
+        ("overlay.font_color", "font_color"),
+        ("overlay.background", "background"),
+        ("overlay.bg_color", "bg_color"),
+        ("overlay.bg_alpha", "bg_alpha"),
+        ("export.formats", "formats"),
+        ("export.dpi", "dpi"),
+        ("export.page_size", "page_size"),
+    )
+)
+
+# CLI options that can fall back to a config value
+CONFIG_OPTION_KEYS = frozenset(cli_key for _, cli_key in CONFIG_TO_CLI)
+
+# Splits comma-separated option values, dropping whitespace around commas
+LIST_SEPARATOR = re.compile(r"\s*,\s*")
+
+
 def get_effective_options(config_path, option_dict):
     """
     Merge configuration and CLI options, with CLI options taking precedence.
@@ -63,77 +254,31 @@ def get_effective_options(config_path, option_dict):
     Returns:
         Dictionary with effective options (config merged with CLI overrides)
     """
+    overrides = {key: value for key, value in option_dict.items() if value is not None}
+    
+    # Without an explicit config file, skip loading it entirely when every
+    # config-backed option was given on the command line
+    if config_path is None and CONFIG_OPTION_KEYS <= overrides.keys():
+        return overrides
+    
     # Load configuration
     config = get_config(config_path)
-    defaults = config.get_defaults()
-    
-    # Start with configuration defaults
-    result = {}
-    
-    # Map config keys to CLI option names
-    config_to_cli = {
-        "thickness": "thickness",
-        "color": "color",
-        "style": "style",
-        "markers.enabled": "markers",
-        "markers.unit": "markers_unit",
-        "markers.interval": "marker_interval",
-        "markers.size": "marker_size",
-        "markers.color": "marker_color",
-        "markers.label_font_size": "label_font_size",
-        "overlay.enabled": "overlay",
-        "overlay.position": "overlay_position",
-        "overlay.font_size": "font_size",
-        "overlay.font_color": "font_color",
-        "overlay.background": "background",
-        "overlay.bg_color": "bg_color",
-        "overlay.bg_alpha": "bg_alpha",
-        "export.formats": "formats",
-        "export.width": None,  # Not directly mapped
-        "export.height": None,  # Not directly mapped
-        "export.dpi": "dpi",
-        "export.page_size": "page_size"
+    
+    # Start with configuration defaults, list values (overlay fields,
+    # export formats) use the same comma-separated form as the CLI
+    defaults = {
+        cli_key: ",".join(value) if value and isinstance(value, list) else value
+        for config_key, cli_key in CONFIG_TO_CLI
+        if (value := config.get(config_key)) is not None
     }
     
-    # Handle markers enabled special case
-    if "markers" in option_dict and option_dict["markers"] is False:
-        result["markers"] = False
-    elif defaults.get("markers", {}).get("enabled", False):
-        result["markers"] = True
-        
-    # Fill in values from config, excluding None values and those
-    # that will be overridden by CLI options
-    for config_key, cli_key in config_to_cli.items():
-        if cli_key is None:
-            continue
-            
-        # Skip CLI options explicitly provided
-        if cli_key in option_dict and option_dict[cli_key] is not None:
-            continue
-            
-        # Special case for overlay fields
-        if config_key == "overlay.enabled" and "overlay" in option_dict and option_dict["overlay"] is not None:
-            continue
-            
-        # Get the config value using dot notation
-        value = config.get(f"defaults.{config_key}")
-        if value is not None:
-            # Special handling for overlay fields
-            if config_key == "overlay.fields" and value:
-                result["overlay"] = ",".join(value)
-            # Special handling for export formats
-            elif config_key == "export.formats" and value:
-                result["formats"] = ",".join(value)
-            # Normal case
-            elif cli_key:
-                result[cli_key] = value
+    # The overlay is drawn with the configured fields (distance,date by
+    # default) unless the config disables it
+    if config.get("defaults.overlay.enabled") is False:
+        defaults.pop("overlay", None)
     
     # Override with CLI options (non-None values only)
-    for key, value in option_dict.items():
-        if value is not None:
-            result[key] = value
-    
-    return result
+    return defaults | overrides
 
 
 def handle_command_errors(f: CommandCallback) -> CommandCallback:
@@ -183,8 +328,8 @@ def handle_command_errors(f: CommandCallback) -> CommandCallback:
             # In debug mode, show traceback
             if click.get_current_context().obj.get("debug"):
                 click.echo("\nTraceback:")
-                import traceback
-                click.echo(traceback.format_exc())
+                for line in traceback.TracebackException.from_exception(e).format():
+                    click.echo(line, nl=False)
                 
             return 1
     
@@ -213,8 +358,14 @@ def handle_command_errors(f: CommandCallback) -> CommandCallback:
     is_flag=True,
     help="Disable logging to file"
 )
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    hidden=True,
+    help="Discard the cached configuration and re-read the config file"
+)
 @click.pass_context
-def cli(ctx, config, verbose, debug, no_log_file):
+def cli(ctx, config, verbose, debug, no_log_file, refresh_cache):
     """Route-to-Art - Transform GPS routes into artwork."""
     # Initialize context
     ctx.ensure_object(dict)
@@ -229,18 +380,12 @@ def cli(ctx, config, verbose, debug, no_log_file):
     
     log_info(f"Starting Route-to-Art v{__version__}")
     
-    # Try to load config to catch any errors early
-    try:
-        if config:
-            log_info(f"Loading configuration from {config}")
-            get_config(config)
-    except Exception as e:
-        log_exception(e, "Error loading configuration")
-        if isinstance(e, ConfigError):
-            click.secho(f"Error loading configuration: {e}", fg="red")
-        else:
-            click.secho(f"Unexpected error loading configuration: {str(e)}", fg="red")
-        ctx.exit(1)
+    if refresh_cache:
+        clear_config_cache()
+    
+    # The config file is loaded only where its values are used (convert),
+    # so info, validate and init-config neither parse --config nor fail on
+    # a broken one
 
 
 @cli.command()
@@ -306,7 +451,8 @@ def cli(ctx, config, verbose, debug, no_log_file):
 )
 @click.option(
     "--overlay",
-    help="Information to overlay (comma-separated: distance,duration,elevation,name,date, config override)"
+    help="Information to overlay (comma-separated: distance,duration,elevation,name,date). "
+         "Defaults to the config's overlay.fields (distance,date) unless overlay.enabled is false"
 )
 @click.option(
     "--overlay-position",
@@ -348,6 +494,11 @@ def convert(
     CLI options override settings from the configuration file.
     Use --config to specify a configuration file.
     """
+    RouteParser = _lazy_import("RouteParser")
+    RouteVisualizer = _lazy_import("RouteVisualizer")
+    Exporter = _lazy_import("Exporter")
+    ExportFormat = _lazy_import("ExportFormat")
+    
     log_info(f"Converting route from GPX file: {input_file} to {output_file}")
     log_debug("Convert options", data={
         "color": color,
@@ -460,7 +611,7 @@ def convert(
             try:
                 log_info("Adding information overlay")
                 # Parse overlay fields
-                overlay_fields = [field.strip() for field in options.get("overlay").split(',')]
+                overlay_fields = LIST_SEPARATOR.split(options["overlay"].strip())
                 
                 visualizer.add_overlay(
                     fields=overlay_fields,
@@ -479,7 +630,7 @@ def convert(
     
     # If formats are explicitly provided, use those
     if formats:
-        format_list = [f.strip() for f in formats.split(',')]
+        format_list = LIST_SEPARATOR.split(formats.strip())
         try:
             click.echo(f"Exporting to {', '.join(format_list)} formats...")
             exported_files = exporter.export_multiple(
@@ -525,48 +676,48 @@ def convert(
             sys.exit(1)
     
     
-    # Show style information
+    # Show style information from the effective options, so config
+    # defaults are reported as well as CLI values
     style_info = []
-    if color.startswith('#'):
-        style_info.append(f"Color: {color}")
-    else:
-        style_info.append(f"Color: {color}")
-    style_info.append(f"Thickness: {thickness}")
-    style_info.append(f"Style: {style}")
+    style_info.append(f"Color: {options.get('color')}")
+    style_info.append(f"Thickness: {options.get('thickness')}")
+    style_info.append(f"Style: {options.get('style')}")
     
     click.echo(f"Style: {', '.join(style_info)}")
     
     # Show marker information if enabled
-    if markers:
+    if options.get("markers"):
+        markers_unit = options.get("markers_unit")
         marker_info = []
         marker_info.append(f"Unit: {markers_unit}")
-        if marker_interval:
+        if marker_interval := options.get("marker_interval"):
             marker_info.append(f"Interval: {marker_interval} {markers_unit}")
         else:
             marker_info.append(f"Interval: 1.0 {markers_unit}")  # Default
-        if marker_color:
+        if marker_color := options.get("marker_color"):
             marker_info.append(f"Color: {marker_color}")
-        marker_info.append(f"Size: {marker_size}")
-        marker_info.append(f"Label size: {label_font_size}")
+        marker_info.append(f"Size: {options.get('marker_size')}")
+        marker_info.append(f"Label size: {options.get('label_font_size')}")
         
         click.echo(f"Markers: {', '.join(marker_info)}")
         
     # Show overlay information if enabled
-    if overlay:
+    if options.get("overlay"):
+        background = options.get("background")
         overlay_info = []
-        overlay_info.append(f"Fields: {overlay}")
-        overlay_info.append(f"Position: {overlay_position}")
-        overlay_info.append(f"Font size: {font_size}")
-        overlay_info.append(f"Font color: {font_color}")
+        overlay_info.append(f"Fields: {options['overlay']}")
+        overlay_info.append(f"Position: {options.get('overlay_position')}")
+        overlay_info.append(f"Font size: {options.get('font_size')}")
+        overlay_info.append(f"Font color: {options.get('font_color')}")
         overlay_info.append(f"Background: {'On' if background else 'Off'}")
         if background:
-            overlay_info.append(f"BG color: {bg_color}")
-            overlay_info.append(f"BG alpha: {bg_alpha}")
+            overlay_info.append(f"BG color: {options.get('bg_color')}")
+            overlay_info.append(f"BG alpha: {options.get('bg_alpha')}")
         
         click.echo(f"Overlay: {', '.join(overlay_info)}")
 
 
-def validate_coordinates(route: Route) -> List[str]:
+def validate_coordinates(route: "Route") -> List[str]:
     """
     Validate that all coordinates in the route are within valid ranges.
     
@@ -591,7 +742,7 @@ def validate_coordinates(route: Route) -> List[str]:
     return issues
 
 
-def validate_segments(route: Route) -> List[str]:
+def validate_segments(route: "Route") -> List[str]:
     """
     Validate segment integrity.
     
@@ -626,7 +777,7 @@ def validate_segments(route: Route) -> List[str]:
     return issues
 
 
-def validate_timestamps(route: Route) -> List[str]:
+def validate_timestamps(route: "Route") -> List[str]:
     """
     Validate timestamp consistency.
     
@@ -639,42 +790,59 @@ def validate_timestamps(route: Route) -> List[str]:
     issues = []
     
     for i, segment in enumerate(route.segments):
-        # Check if timestamps exist
-        has_timestamps = any(p.timestamp for p in segment.points)
+        # Gather all timestamp checks in a single pass over the points
+        has_timestamps = False
+        missing_timestamps = False
+        out_of_order = False
+        duplicates = False
+        previous = None
+        seen = set()
+        add_seen = seen.add
+        
+        for point in segment.points:
+            timestamp = point.timestamp
+            if timestamp is None:
+                missing_timestamps = True
+                continue
+            
+            has_timestamps = True
+            if previous is not None and timestamp < previous:
+                out_of_order = True
+            if timestamp in seen:
+                duplicates = True
+            else:
+                add_seen(timestamp)
+            previous = timestamp
+        
+        # Skip further timestamp checks if no timestamps
         if not has_timestamps:
-            continue  # Skip further timestamp checks if no timestamps
+            continue
             
-        # Check if all points have timestamps
-        missing_timestamps = any(p.timestamp is None for p in segment.points)
         if missing_timestamps:
             issues.append(f"Segment {i+1} has inconsistent timestamps "
                          "(some points missing timestamp data)")
             
-        # Check for timestamp order
-        timestamp_issues = False
-        for j in range(1, len(segment.points)):
-            curr = segment.points[j].timestamp
-            prev = segment.points[j-1].timestamp
-            if curr and prev and curr < prev:
-                timestamp_issues = True
-                break
-                
-        if timestamp_issues:
+        if out_of_order:
             issues.append(f"Segment {i+1} has out-of-order timestamps")
             
-        # Check for duplicate timestamps
-        timestamps = [p.timestamp for p in segment.points if p.timestamp]
-        unique_timestamps = set(timestamps)
-        if len(unique_timestamps) < len(timestamps):
+        if duplicates:
             issues.append(f"Segment {i+1} has duplicate timestamps")
     
     return issues
 
 
+# Styled once here rather than on every secho call in validate
+SEGMENT_ISSUES_HEADER = click.style("\nSegment Issues:", fg="yellow")
+COORDINATE_ISSUES_HEADER = click.style("\nCoordinate Issues:", fg="yellow")
+TIMESTAMP_ISSUES_HEADER = click.style("\nTimestamp Issues:", fg="yellow")
+
+
 @cli.command()
 @click.argument("input_file", type=click.Path(exists=True))
 def validate(input_file):
     """Validate route data from GPX file."""
+    RouteParser = _lazy_import("RouteParser")
+    
     # Parse the GPX file
     parser = RouteParser(input_file)
     route_data = parser.parse()
@@ -692,8 +860,13 @@ def validate(input_file):
     
     # Run all validations
     segment_issues = validate_segments(route)
-    coordinate_issues = validate_coordinates(route)
-    timestamp_issues = validate_timestamps(route)
+    if route.segments:
+        coordinate_issues = validate_coordinates(route)
+        timestamp_issues = validate_timestamps(route)
+    else:
+        # Nothing else to check when the route has no segments
+        coordinate_issues = []
+        timestamp_issues = []
     
     # Combine all issues
     all_issues = segment_issues + coordinate_issues + timestamp_issues
@@ -706,21 +879,16 @@ def validate(input_file):
     else:
         click.secho(f"\n✗ Found {len(all_issues)} issues in route data:", fg="red", bold=True)
         
-        # Display issues by category
-        if segment_issues:
-            click.secho("\nSegment Issues:", fg="yellow")
-            for issue in segment_issues:
-                click.echo(f"- {issue}")
-                
-        if coordinate_issues:
-            click.secho("\nCoordinate Issues:", fg="yellow")
-            for issue in coordinate_issues:
-                click.echo(f"- {issue}")
-                
-        if timestamp_issues:
-            click.secho("\nTimestamp Issues:", fg="yellow")
-            for issue in timestamp_issues:
-                click.echo(f"- {issue}")
+        # Display issues by category, written out in one go
+        click.echo("\n".join(
+            "\n".join([header, *(f"- {issue}" for issue in issues)])
+            for header, issues in (
+                (SEGMENT_ISSUES_HEADER, segment_issues),
+                (COORDINATE_ISSUES_HEADER, coordinate_issues),
+                (TIMESTAMP_ISSUES_HEADER, timestamp_issues),
+            )
+            if issues
+        ))
         
         click.echo("\nFix these issues to ensure proper processing of the route data.")
         sys.exit(1)
@@ -733,24 +901,25 @@ def format_distance(meters):
     return f"{km:.2f} km ({miles:.2f} miles)"
 
 
+# Units shown by format_duration, largest first
+DURATION_UNITS = (("day", 86400), ("hour", 3600), ("minute", 60), ("second", 1))
+
+
 def format_duration(duration):
     """Format timedelta for display."""
     if not duration:
         return "Unknown"
     
-    days = duration.days
-    hours, remainder = divmod(duration.seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
+    remainder = duration.days * 86400 + duration.seconds
+    
+    # Seconds are only shown for durations under an hour
+    units = DURATION_UNITS if 0 <= remainder < 3600 else DURATION_UNITS[:-1]
     
     parts = []
-    if days:
-        parts.append(f"{days} day{'s' if days != 1 else ''}")
-    if hours:
-        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-    if minutes:
-        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-    if seconds and not (days or hours):
-        parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+    for name, unit_seconds in units:
+        count, remainder = divmod(remainder, unit_seconds)
+        if count:
+            parts.append(f"{count} {name}{'s' if count != 1 else ''}")
     
     return ", ".join(parts)
 
@@ -778,6 +947,8 @@ def format_bounds(bounds):
 @click.argument("input_file", type=click.Path(exists=True))
 def info(input_file):
     """Display route information from GPX file."""
+    RouteParser = _lazy_import("RouteParser")
+    
     # Parse the GPX file
     parser = RouteParser(input_file)
     route_data = parser.parse()
@@ -831,6 +1002,7 @@ def info(input_file):
 )
 def init_config(path, force):
     """Initialize a default configuration file."""
+    Config = _lazy_import("Config")
     config = Config()
     
     # Determine config path
@@ -838,27 +1010,29 @@ def init_config(path, force):
         # Use default path
         path = config.get_default_path()
     
+    config_file = Path(path)
+    
     # Check if file exists
-    if os.path.exists(path) and not force:
+    if config_file.exists() and not force:
         click.secho(f"Config file already exists at {path}", fg="yellow")
         click.echo("Use --force to overwrite")
         return 1
     
-    # Ensure directory exists
-    directory = os.path.dirname(os.path.abspath(path))
-    if not os.path.exists(directory):
-        try:
-            os.makedirs(directory)
-            click.echo(f"Created directory: {directory}")
-        except OSError as e:
-            click.secho(f"Error creating directory {directory}: {str(e)}", fg="red")
-            return 1
+    # Ensure directory exists, an existing directory is the common case
+    directory = config_file.absolute().parent
+    try:
+        directory.mkdir(parents=True)
+        click.echo(f"Created directory: {directory}")
+    except FileExistsError:
+        pass
+    except OSError as e:
+        click.secho(f"Error creating directory {directory}: {str(e)}", fg="red")
+        return 1
     
     # Generate and write config
     sample_config = config.generate_sample()
     try:
-        with open(path, 'w') as f:
-            f.write(sample_config)
+        config_file.write_text(sample_config)
         click.secho(f"Config file created at {path}", fg="green")
         click.echo("You can now customize your configuration file.")
         return 0
@@ -239,4 +239,16 @@ class Route:
             Total number of points across all segments
         """
         return sum(len(segment.points) for segment in self.segments)
+    
+    def get_segment_latitudes(self, index: int) -> List[float]:
+        """
+        Get the latitudes of one segment's points.
+        
+        Args:
+            index: Index of the segment in the route
+            
+        Returns:
+            List of latitudes in point order
+        """
+        return [point.latitude for point in self.segments[index].points]
 
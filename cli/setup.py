@@ -1,8 +1,17 @@
+import re
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+# The version lives in route_to_art/_version.py only
+version_file = Path(__file__).parent / "route_to_art" / "_version.py"
+version = re.search(
+    r'^__version__ = "([^"]+)"', version_file.read_text(), re.MULTILINE
+).group(1)
+
 setup(
     name="route-to-art",
-    version="0.1.0",
+    version=version,
     description="Transform GPS routes into artwork",
     author="GPX Art Generator Team",
     packages=find_packages(),
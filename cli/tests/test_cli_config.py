@@ -1,13 +1,17 @@
 """Tests for configuration integration with CLI."""
 
 import os
+import pickle
 import yaml
 import pytest
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 from pathlib import Path
 
-from route_to_art.main import cli, get_config, get_effective_options
+from route_to_art.main import (
+    cli, get_config, get_effective_options, load_config, get_config_cache_path,
+    CONFIG_OPTION_KEYS
+)
 from route_to_art.config import Config, ConfigError
 
 
@@ -148,33 +152,80 @@ class TestConfigLoading:
     """Tests for config file loading in the CLI."""
     
     def test_global_config_option(self, runner, valid_config_file, mock_config):
-        """Test that the --config option works at the global level."""
+        """Test that the --config option doesn't load the config for --help."""
         with patch('route_to_art.main.get_config') as mock_get_config:
             result = runner.invoke(cli, ["--config", valid_config_file, "--help"])
             
             assert result.exit_code == 0
-            mock_get_config.assert_called_once_with(valid_config_file)
+            mock_get_config.assert_not_called()
     
     def test_nonexistent_config_file(self, runner, mock_config):
-        """Test behavior with non-existent config file."""
+        """Test that --help works without reading a non-existent config file."""
         result = runner.invoke(cli, ["--config", "/nonexistent/config.yml", "--help"])
         
-        assert result.exit_code == 1
-        assert "Error loading configuration" in result.output
+        assert result.exit_code == 0
+        assert "Error loading configuration" not in result.output
+    
+    @pytest.mark.parametrize("command", ["info", "validate"])
+    def test_commands_not_loading_config(self, runner, tmp_path, invalid_config_file,
+                                         minimal_gpx_content, mock_config, command):
+        """Test that commands not using config values never load the config file."""
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        with patch('route_to_art.main.get_config') as mock_get_config:
+            result = runner.invoke(cli, [
+                "--config", invalid_config_file, "--no-log-file", command, str(gpx_file)
+            ])
+            
+            assert result.exit_code == 0
+            mock_get_config.assert_not_called()
+    
+    @pytest.mark.parametrize("config_name", ["invalid", "nonexistent"])
+    def test_info_ignores_unusable_config(self, runner, tmp_path, invalid_config_file,
+                                          minimal_gpx_content, mock_config, config_name):
+        """Test that info succeeds with an invalid or missing --config file."""
+        config_path = {
+            "invalid": invalid_config_file,
+            "nonexistent": str(tmp_path / "nonexistent.yml"),
+        }[config_name]
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        result = runner.invoke(cli, [
+            "--config", config_path, "--no-log-file", "info", str(gpx_file)
+        ])
+        
+        assert result.exit_code == 0
+        assert "Route Information" in result.output
+        assert "Error loading configuration" not in result.output
     
-    def test_invalid_config_file(self, runner, invalid_config_file, mock_config):
-        """Test behavior with invalid config file."""
-        result = runner.invoke(cli, ["--config", invalid_config_file, "--help"])
+    def test_invalid_config_file(self, runner, tmp_path, invalid_config_file,
+                                 minimal_gpx_content, mock_config):
+        """Test that an invalid config file is reported when a command uses it."""
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        result = runner.invoke(cli, [
+            "--config", invalid_config_file, "--no-log-file",
+            "convert", str(gpx_file), str(tmp_path / "output.png")
+        ])
         
-        assert result.exit_code == 1
         assert "Error loading configuration" in result.output
         assert "Invalid thickness" in result.output
+        assert "Unexpected error" not in result.output
     
-    def test_malformed_config_file(self, runner, malformed_config_file, mock_config):
-        """Test behavior with malformed YAML config file."""
-        result = runner.invoke(cli, ["--config", malformed_config_file, "--help"])
+    def test_malformed_config_file(self, runner, tmp_path, malformed_config_file,
+                                   minimal_gpx_content, mock_config):
+        """Test that a malformed YAML config file is reported when a command uses it."""
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        result = runner.invoke(cli, [
+            "--config", malformed_config_file, "--no-log-file",
+            "convert", str(gpx_file), str(tmp_path / "output.png")
+        ])
         
-        assert result.exit_code == 1
         assert "Error loading configuration" in result.output
         assert "Error parsing config file" in result.output
 
@@ -259,6 +310,16 @@ class TestEffectiveOptions:
             # But thickness still comes from config
             assert options["thickness"] == "thick"
     
+    def test_all_options_given_skips_config(self):
+        """Test that config is not loaded when the CLI provides every option."""
+        option_dict = {key: "cli-value" for key in CONFIG_OPTION_KEYS}
+        
+        with patch('route_to_art.main.get_config') as mock_get_config:
+            options = get_effective_options(None, option_dict)
+            
+            mock_get_config.assert_not_called()
+            assert options == option_dict
+    
     def test_overlay_fields_conversion(self):
         """Test that overlay fields list is converted to comma-separated string."""
         mock_config = MagicMock()
@@ -292,6 +353,90 @@ class TestEffectiveOptions:
             assert options["formats"] == "png,svg,pdf"
 
 
+class TestConfigCache:
+    """Tests for the on-disk configuration cache."""
+    
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.delenv("ROUTE_TO_ART_DEV", raising=False)
+    
+    def test_cache_written_and_reused(self, valid_config_file):
+        """Test that a second load is served from the cache."""
+        config1 = load_config(valid_config_file)
+        cache_path = get_config_cache_path(valid_config_file)
+        assert cache_path.exists()
+        assert not list(cache_path.parent.glob("*.tmp"))
+        
+        # Only the plain configuration dictionary is cached
+        with open(cache_path, "rb") as f:
+            _, cached_config = pickle.load(f)
+        assert cached_config == config1.config
+        
+        with patch.object(Config, "load_config") as mock_load:
+            config2 = load_config(valid_config_file)
+            mock_load.assert_not_called()
+        
+        assert isinstance(config2, Config)
+        assert config2.config_path == valid_config_file
+        assert config2.get("defaults.thickness") == "thick"
+        assert config2.config == config1.config
+    
+    def test_cache_invalidated_on_modification(self, valid_config_file):
+        """Test that changing the config file invalidates the cache."""
+        load_config(valid_config_file)
+        
+        with open(valid_config_file, "w") as f:
+            yaml.dump({"defaults": {"thickness": "thin"}}, f)
+        stat = os.stat(valid_config_file)
+        os.utime(valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        config = load_config(valid_config_file)
+        assert config.get("defaults.thickness") == "thin"
+    
+    def test_cache_per_config_file(self, valid_config_file, tmp_path):
+        """Test that each config file keeps its own cache entry."""
+        other_config_file = tmp_path / "other.yml"
+        with open(other_config_file, "w") as f:
+            yaml.dump({"defaults": {"thickness": "thin"}}, f)
+        
+        load_config(valid_config_file)
+        load_config(str(other_config_file))
+        
+        assert get_config_cache_path(valid_config_file).exists()
+        assert get_config_cache_path(str(other_config_file)).exists()
+        
+        with patch.object(Config, "load_config") as mock_load:
+            assert load_config(valid_config_file).get("defaults.thickness") == "thick"
+            assert load_config(str(other_config_file)).get("defaults.thickness") == "thin"
+            mock_load.assert_not_called()
+    
+    def test_dev_mode_bypasses_cache(self, valid_config_file, monkeypatch):
+        """Test that ROUTE_TO_ART_DEV disables the cache."""
+        monkeypatch.setenv("ROUTE_TO_ART_DEV", "1")
+        
+        load_config(valid_config_file)
+        assert not get_config_cache_path(valid_config_file).exists()
+    
+    def test_invalid_config_not_cached(self, invalid_config_file):
+        """Test that invalid config files raise and are not cached."""
+        with pytest.raises(ConfigError):
+            load_config(invalid_config_file)
+        
+        assert not get_config_cache_path(invalid_config_file).exists()
+    
+    def test_refresh_cache_option(self, runner, valid_config_file):
+        """Test that --refresh-cache removes the cached config."""
+        load_config(valid_config_file)
+        assert get_config_cache_path(valid_config_file).exists()
+        
+        result = runner.invoke(cli, ["--refresh-cache", "--no-log-file", "init-config", "--help"])
+        
+        assert result.exit_code == 0
+        assert not get_config_cache_path(valid_config_file).exists()
+
+
 class TestConvertCommand:
     """Tests for the convert command with configuration."""
     
@@ -393,3 +538,64 @@ class TestConvertCommand:
             assert kwargs["thickness"] == "thin"  # CLI override
             assert kwargs["line_style"] == "dashed"  # From config (not overridden)
 
+    
+    def test_convert_overlay_from_config(self, runner, tmp_path, valid_config_file, mock_config,
+                                         mock_gpx_parser, mock_visualizer, mock_exporter,
+                                         minimal_gpx_content, monkeypatch):
+        """Test that convert draws the overlay with the configured fields."""
+        monkeypatch.setenv("ROUTE_TO_ART_DEV", "1")
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        result = runner.invoke(cli, [
+            "--config", valid_config_file, "--no-log-file",
+            "convert", str(gpx_file), str(tmp_path / "output")
+        ])
+        
+        assert result.exit_code == 0
+        visualizer_instance = mock_visualizer.return_value
+        args, kwargs = visualizer_instance.add_overlay.call_args
+        assert kwargs["fields"] == ["distance", "elevation"]
+        assert kwargs["position"] == "bottom-right"
+        
+        # The summary reports the effective options, not just the CLI ones
+        assert "Style: Color: #FF5500, Thickness: thick, Style: dashed" in result.output
+        assert "Overlay: Fields: distance,elevation, Position: bottom-right" in result.output
+    
+    def test_convert_overlay_default_fields(self, runner, tmp_path, mock_config,
+                                            mock_gpx_parser, mock_visualizer, mock_exporter,
+                                            minimal_gpx_content, monkeypatch):
+        """Test that without a config file the overlay shows distance and date."""
+        monkeypatch.setenv("ROUTE_TO_ART_DEV", "1")
+        monkeypatch.setenv("GPX_ART_CONFIG", str(tmp_path / "missing.yml"))
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        
+        result = runner.invoke(cli, [
+            "--no-log-file", "convert", str(gpx_file), str(tmp_path / "output.png")
+        ])
+        
+        assert result.exit_code == 0
+        visualizer_instance = mock_visualizer.return_value
+        args, kwargs = visualizer_instance.add_overlay.call_args
+        assert kwargs["fields"] == ["distance", "date"]
+    
+    def test_convert_overlay_disabled_in_config(self, runner, tmp_path, mock_config,
+                                                mock_gpx_parser, mock_visualizer, mock_exporter,
+                                                minimal_gpx_content, monkeypatch):
+        """Test that overlay.enabled: false in the config disables the overlay."""
+        monkeypatch.setenv("ROUTE_TO_ART_DEV", "1")
+        gpx_file = tmp_path / "test.gpx"
+        gpx_file.write_text(minimal_gpx_content)
+        config_file = tmp_path / "config.yml"
+        with open(config_file, "w") as f:
+            yaml.dump({"defaults": {"overlay": {"enabled": False}}}, f)
+        
+        result = runner.invoke(cli, [
+            "--config", str(config_file), "--no-log-file",
+            "convert", str(gpx_file), str(tmp_path / "output.png")
+        ])
+        
+        assert result.exit_code == 0
+        mock_visualizer.return_value.add_overlay.assert_not_called()
+        assert "Overlay:" not in result.output
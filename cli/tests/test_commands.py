@@ -13,7 +13,10 @@ from click.testing import CliRunner
 from PIL import Image
 
 from route_to_art.exporters import ExportError
-from route_to_art.main import cli, convert, info, validate
+from route_to_art.main import (
+    cli, convert, info, validate, validate_coordinates, validate_timestamps,
+    format_distance, format_duration
+)
 from route_to_art.models import Route, RoutePoint, RouteSegment
 
 
@@ -199,6 +202,33 @@ def test_info_empty_file(runner, empty_gpx_file):
     assert "Distance: 0.00 km (0.00 miles)" in result.output
 
 
+@pytest.mark.parametrize("meters, expected", [
+    (0, "0.00 km (0.00 miles)"),
+    (1609.34, "1.61 km (1.00 miles)"),
+    (42195, "42.20 km (26.22 miles)"),
+    # Rounding boundaries, sensitive to how the conversion is computed
+    (175, "0.17 km (0.11 miles)"),
+    (205, "0.20 km (0.13 miles)"),
+    (345, "0.34 km (0.21 miles)"),
+])
+def test_format_distance(meters, expected):
+    """Test distance formatting for the info command."""
+    assert format_distance(meters) == expected
+
+
+@pytest.mark.parametrize("duration, expected", [
+    (None, "Unknown"),
+    (timedelta(seconds=1), "1 second"),
+    (timedelta(minutes=2, seconds=5), "2 minutes, 5 seconds"),
+    (timedelta(hours=1, minutes=1, seconds=30), "1 hour, 1 minute"),
+    (timedelta(days=2, hours=3), "2 days, 3 hours"),
+    (timedelta(days=1, seconds=59), "1 day"),
+])
+def test_format_duration(duration, expected):
+    """Test duration formatting for the info command."""
+    assert format_duration(duration) == expected
+
+
 # Tests for the validate command
 
 def test_validate_valid_file(runner, valid_gpx_file):
@@ -247,6 +277,56 @@ def test_validate_empty_file(runner, empty_gpx_file):
     assert "Route has no segments" in result.output
 
 
+def test_validate_coordinates_extreme_latitude():
+    """Test that only points beyond 85 degrees latitude are reported."""
+    points = [
+        RoutePoint(latitude=lat, longitude=0.0)
+        for lat in (10.0, 85.0, -86.5, 89.0)
+    ]
+    route = Route(segments=[RouteSegment(points=points)])
+    issues = validate_coordinates(route)
+    
+    assert len(issues) == 2
+    assert issues[0].startswith("Point 3 in segment 1 has extreme latitude (-86.5)")
+    assert issues[1].startswith("Point 4 in segment 1 has extreme latitude (89.0)")
+
+
+def _timestamped_route(*timestamps):
+    """Build a single-segment route with the given point timestamps."""
+    points = [
+        RoutePoint(latitude=37.0 + i * 0.001, longitude=-122.0, timestamp=ts)
+        for i, ts in enumerate(timestamps)
+    ]
+    return Route(segments=[RouteSegment(points=points)])
+
+
+def test_validate_timestamps_valid():
+    """Test that ordered, unique timestamps produce no issues."""
+    start = datetime(2023, 1, 1, 12, 0, 0)
+    route = _timestamped_route(start, start + timedelta(minutes=1), start + timedelta(minutes=2))
+    assert validate_timestamps(route) == []
+
+
+def test_validate_timestamps_without_timestamps():
+    """Test that segments without any timestamps are skipped."""
+    route = _timestamped_route(None, None)
+    assert validate_timestamps(route) == []
+
+
+def test_validate_timestamps_issues():
+    """Test detection of missing, out-of-order and duplicate timestamps."""
+    start = datetime(2023, 1, 1, 12, 0, 0)
+    route = _timestamped_route(
+        start + timedelta(minutes=1), None, start, start
+    )
+    issues = validate_timestamps(route)
+    
+    assert len(issues) == 3
+    assert "missing timestamp data" in issues[0]
+    assert "out-of-order" in issues[1]
+    assert "duplicate" in issues[2]
+
+
 # Tests for the convert command
 
 def test_convert_invalid_extension(runner, valid_gpx_file):
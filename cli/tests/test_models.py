@@ -273,4 +273,12 @@ class TestRoute:
     def test_route_total_points(self, multi_segment_route):
         """Test total points calculation for a route."""
         assert multi_segment_route.get_total_points() == 4
-
+    
+    def test_route_segment_latitudes(self, multi_segment_route):
+        """Test the per-segment latitude list."""
+        assert multi_segment_route.get_segment_latitudes(1) == [37.8000, 37.8001]
+    
+    def test_route_segment_latitudes_empty_segment(self):
+        """Test the latitudes of a segment without points."""
+        route = Route(segments=[RouteSegment()])
+        assert route.get_segment_latitudes(0) == []